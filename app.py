@@ -10,34 +10,74 @@ Features:
 - Copy result to clipboard and About dialog
 """
 
+import io
 import json
 import os
-import math
+import queue
+import threading
 import time
 import tkinter as tk
+from functools import partial
 from tkinter import ttk, messagebox
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
 
-APP_DIR = os.path.dirname(os.path.abspath(__file__))
-HISTORY_FILE = os.path.join(APP_DIR, "tip_history.json")
 
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_FILE = os.path.join(APP_DIR, "tip_history.jsonl")
+# pre-JSONL history file, read once if the new one doesn't exist yet
+LEGACY_HISTORY_FILE = os.path.join(APP_DIR, "tip_history.json")
 
 def load_history():
     try:
         with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+            lines = f.readlines()
+    except Exception:
+        return _load_legacy_history()
+    entries = []
+    for line in lines[-20:]:
+        try:
+            entries.append(_loads(line))
+        except Exception:
+            pass
+    # newest entry is appended last; in memory we keep newest first
+    entries.reverse()
+    if len(lines) > 200:
+        _compact_history(entries)
+    return entries
+
+
+def _load_legacy_history():
+    try:
+        with open(LEGACY_HISTORY_FILE, "r", encoding="utf-8") as f:
+            entries = _loads(f.read())[:20]
     except Exception:
         return []
+    # migrate once: write the entries to the jsonl file now, otherwise the
+    # first post-switch save would strand them in the legacy file
+    _compact_history(entries)
+    return entries
 
 
-def save_history(entry):
-    h = load_history()
-    h.insert(0, entry)
-    # keep last 20
-    h = h[:20]
+def _compact_history(entries):
+    # rewrite the file down to the 20 live entries (oldest first on disk)
     try:
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(h, f, ensure_ascii=False, indent=2)
+        tmp = HISTORY_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for e in reversed(entries):
+                f.write(_dumps(e) + "\n")
+        os.replace(tmp, HISTORY_FILE)
     except Exception:
         pass
 
@@ -48,8 +88,92 @@ class TipCalculator(tk.Tk):
         self.title("Tip Calculator")
         self.resizable(False, False)
         self.style = ttk.Style(self)
+        # register the dark palette once; toggling is then a single
+        # theme_use call instead of per-style reconfiguration
+        self.style.theme_create("dark", parent="clam", settings={
+            ".": {"configure": {"background": "#2e2e2e",
+                                "foreground": "#ffffff"}},
+            "TButton": {"configure": {"background": "#444444"}},
+        })
+        self.style.theme_use("clam")
         self._use_dark = False
+        # history lives in memory; the file is only touched on load/save
+        self._history = load_history()
+        # result formatter specialized on the currency symbol; rebuilt
+        # only when the symbol actually changes
+        self._fmt_currency = None
+        self._fmt_money = None
+        # reused serialization buffer, avoids a fresh allocation per save
+        # (only ever touched from the writer thread)
+        self._json_buf = io.StringIO()
+        # file writes happen off the Tk thread so Calculate never blocks;
+        # rapid Calculates are additionally coalesced before being queued
+        self._write_q = queue.Queue()
+        self._unsaved = []
+        self._save_pending = False
+        self._writer_done = threading.Event()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
         self._build_ui()
+        # deferred writes must hit disk before the daemon writer dies
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def save_history(self, entry):
+        self._history.insert(0, entry)
+        # keep last 20
+        del self._history[20:]
+        self._unsaved.append(entry)
+        if not self._save_pending:
+            self._save_pending = True
+            self.after(250, self._flush_history)
+
+    def _flush_history(self):
+        self._save_pending = False
+        for e in self._unsaved:
+            self._write_q.put(e)
+        self._unsaved.clear()
+
+    def _on_close(self):
+        # queue anything still waiting on the after(250) timer, then ask
+        # the writer to drain and stop (None sentinel) and wait for it
+        self._flush_history()
+        self._write_q.put(None)
+        self._writer_done.wait(timeout=2.0)
+        self.destroy()
+
+    def _writer_loop(self):
+        closing = False
+        while not closing:
+            entries = []
+            item = self._write_q.get()
+            if item is None:
+                closing = True
+            else:
+                entries.append(item)
+                # coalesce bursts into one append
+                try:
+                    while True:
+                        item = self._write_q.get(timeout=0.1)
+                        if item is None:
+                            closing = True
+                            break
+                        entries.append(item)
+                except queue.Empty:
+                    pass
+            try:
+                if entries:
+                    self._json_buf.seek(0)
+                    self._json_buf.truncate()
+                    for e in entries:
+                        self._json_buf.write(_dumps(
+                            {k: v for k, v in e.items()
+                             if not k.startswith("_")}))
+                        self._json_buf.write("\n")
+                    # append-only: one logical change costs one line of I/O
+                    with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+                        f.write(self._json_buf.getvalue())
+            except Exception:
+                pass
+        self._writer_done.set()
 
     def _build_ui(self):
         pad = 8
@@ -59,16 +183,17 @@ class TipCalculator(tk.Tk):
         # Bill
         ttk.Label(main, text="Bill amount ($):").grid(
             row=0, column=0, sticky="w")
-        self.bill_var = tk.StringVar(value="0.00")
-        self.bill_entry = ttk.Entry(main, textvariable=self.bill_var, width=20)
+        # plain widgets, read with .get() at calculate time; Tk variables
+        # would cost a Tcl round-trip per access for no benefit here
+        self.bill_entry = ttk.Entry(main, width=20)
+        self.bill_entry.insert(0, "0.00")
         self.bill_entry.grid(row=0, column=1, sticky="e")
 
         # Currency
         ttk.Label(main, text="Currency symbol/text:").grid(row=0,
                                                            column=2, sticky="w", padx=(10, 0))
-        self.currency_var = tk.StringVar(value="$")
-        self.currency_entry = ttk.Entry(
-            main, textvariable=self.currency_var, width=6)
+        self.currency_entry = ttk.Entry(main, width=6)
+        self.currency_entry.insert(0, "$")
         self.currency_entry.grid(row=0, column=3, sticky="w")
 
         # Tip presets
@@ -77,25 +202,18 @@ class TipCalculator(tk.Tk):
         presets.grid(row=1, column=1, sticky="e")
         for p in (10, 12, 15):
             b = ttk.Button(presets, text=f"{p}%",
-                           command=lambda v=p: self.set_tip(v))
+                           command=partial(self.set_tip, p))
             b.pack(side="left", padx=2)
 
         # Tip slider and custom
         self.tip_var = tk.DoubleVar(value=15.0)
         # label var to display live percent
         self.tip_display_var = tk.StringVar(value=f"{self.tip_var.get():.1f}%")
-        # use command callback so label updates while dragging
-
-        def on_tip_change(val):
-            try:
-                v = float(val)
-            except Exception:
-                v = self.tip_var.get()
-            self.tip_var.set(v)
-            self.tip_display_var.set(f"{v:.1f}%")
-
+        # command callback updates the label while dragging, debounced to
+        # ~60 Hz so a drag doesn't flood Tk with per-pixel updates
+        self._tip_after_id = None
         self.tip_scale = ttk.Scale(
-            main, from_=0, to=50, variable=self.tip_var, orient="horizontal", command=on_tip_change)
+            main, from_=0, to=50, variable=self.tip_var, orient="horizontal", command=self.on_tip_change)
         self.tip_scale.grid(row=2, column=0, columnspan=2,
                             sticky="we", pady=(4, 0))
         self.tip_label = ttk.Label(main, textvariable=self.tip_display_var)
@@ -104,9 +222,8 @@ class TipCalculator(tk.Tk):
         # People
         ttk.Label(main, text="Split between (# people):").grid(
             row=4, column=0, sticky="w")
-        self.people_var = tk.IntVar(value=1)
-        self.people_spin = ttk.Spinbox(
-            main, from_=1, to=100, textvariable=self.people_var, width=6)
+        self.people_spin = ttk.Spinbox(main, from_=1, to=100, width=6)
+        self.people_spin.set(1)
         self.people_spin.grid(row=4, column=1, sticky="e")
 
         # Round up
@@ -154,22 +271,26 @@ class TipCalculator(tk.Tk):
         about_btn = ttk.Button(bottom, text="About", command=self.show_about)
         about_btn.pack(side="right")
 
-        # Wire events
-        # already update via command; keep trace for other updates
-        self.tip_var.trace_add("write", lambda *a: self._update_tip_label())
-
-        # initialize history
-        self._update_history_list()
+        # populate history once the window has painted
+        self.after_idle(self._update_history_list)
         self._update_tip_label()
 
-    def _tip_text(self):
-        return tk.StringVar(value=f"Tip: {self.tip_var.get():.1f}%")
+    def on_tip_change(self, val):
+        # Scale always hands us a numeric string and already owns tip_var,
+        # so no guard and no tip_var.set here
+        v = float(val)
+        if self._tip_after_id is not None:
+            self.after_cancel(self._tip_after_id)
+        self._tip_after_id = self.after(16, self._apply_tip, v)
+
+    def _apply_tip(self, v):
+        self._tip_after_id = None
+        self.tip_display_var.set(f"{v:.1f}%")
 
     def _update_tip_label(self):
-        try:
-            self.tip_label.config(text=f"Tip: {self.tip_var.get():.1f}%")
-        except Exception:
-            pass
+        # single direct update path; called explicitly wherever tip_var
+        # is set programmatically (the slider goes through _apply_tip)
+        self.tip_display_var.set(f"{self.tip_var.get():.1f}%")
 
     def set_tip(self, percent: float):
         self.tip_var.set(percent)
@@ -178,17 +299,18 @@ class TipCalculator(tk.Tk):
     def calculate(self):
         # Validate inputs
         try:
-            bill = float(self.bill_var.get())
+            # work in integer cents: exact, and no round() needed later
+            bill_c = int(round(float(self.bill_entry.get()) * 100))
         except Exception:
             messagebox.showerror(
                 "Input error", "Please enter a valid bill amount.")
             return
-        if bill < 0:
+        if bill_c < 0:
             messagebox.showerror(
                 "Input error", "Bill amount cannot be negative.")
             return
         try:
-            people = int(self.people_var.get())
+            people = int(self.people_spin.get())
             if people < 1:
                 raise ValueError()
         except Exception:
@@ -197,32 +319,49 @@ class TipCalculator(tk.Tk):
             return
 
         tip_percent = float(self.tip_var.get())
-        tip_amount = bill * (tip_percent / 100.0)
-        total_bill = bill + tip_amount
-        per_person = total_bill / people
-        if self.round_var.get():
-            per_person = math.ceil(per_person * 100) / 100.0
-
-        c = self.currency_var.get() or "$"
-        result = (
-            f"Bill: {c}{bill:.2f}\n"
-            f"Tip ({tip_percent:.1f}%): {c}{tip_amount:.2f}\n"
-            f"Total: {c}{total_bill:.2f}\n"
-            f"Each (x{people}): {c}{per_person:.2f}"
-        )
-        self.result_text.set(result)
+        tip_bp = int(round(tip_percent * 100))  # basis points
+        tip_c = bill_c * tip_bp // 10000
+        total_c = bill_c + tip_c
+        # bool-as-int: adds the ceiling bias only when rounding up
+        per_c = (total_c + (people - 1) * self.round_var.get()) // people
+
+        bill_r = bill_c / 100
+        tip_r = tip_c / 100
+        tot_r = total_c / 100
+        pp_r = per_c / 100
+
+        c = self.currency_entry.get() or "$"
+        self.result_text.set(self._money_formatter(c)(
+            b=bill_r, tp=tip_percent, ta=tip_r, tb=tot_r, p=people, pp=pp_r))
 
         # save to history
+        now = int(time.time())
         entry = {
-            "time": int(time.time()),
-            "bill": round(bill, 2),
-            "tip_percent": round(tip_percent, 2),
+            "time": now,
+            "time_str": time.strftime("%Y-%m-%d %H:%M:%S",
+                                      time.localtime(now)),
+            "bill": bill_r,
+            "tip_percent": tip_bp / 100,
             "people": people,
-            "per_person": round(per_person, 2),
-            "total": round(total_bill, 2),
+            "per_person": pp_r,
+            "total": tot_r,
         }
-        save_history(entry)
-        self._update_history_list()
+        self.save_history(entry)
+        self._append_history_row(entry)
+
+    def _money_formatter(self, c):
+        if c != self._fmt_currency:
+            self._fmt_currency = c
+            # the symbol is free text; escape braces so it can't break
+            # the template
+            e = c.replace("{", "{{").replace("}", "}}")
+            self._fmt_money = (
+                f"Bill: {e}{{b:.2f}}\n"
+                f"Tip ({{tp:.1f}}%): {e}{{ta:.2f}}\n"
+                f"Total: {e}{{tb:.2f}}\n"
+                f"Each (x{{p}}): {e}{{pp:.2f}}"
+            ).format
+        return self._fmt_money
 
     def copy_result(self):
         txt = self.result_text.get()
@@ -236,49 +375,59 @@ class TipCalculator(tk.Tk):
             messagebox.showerror("Copy failed", "Could not copy to clipboard.")
 
     def clear_inputs(self):
-        self.bill_var.set("0.00")
+        self.bill_entry.delete(0, tk.END)
+        self.bill_entry.insert(0, "0.00")
         self.tip_var.set(15)
-        self.people_var.set(1)
+        self.people_spin.set(1)
         self.round_var.set(False)
         self.result_text.set("No calculation yet")
 
+    def _format_history_row(self, item):
+        # entries are immutable once saved, so the display string is
+        # computed once and cached on the entry (underscore keys are
+        # stripped before the entry hits disk)
+        s = item.get("_display")
+        if s is None:
+            t = item.get("time_str")
+            if t is None:
+                t = time.strftime("%Y-%m-%d %H:%M:%S",
+                                  time.localtime(item.get("time", 0)))
+            c = self.currency_entry.get() or "$"
+            s = f"{t} — {c}{item.get('bill'):.2f} +{item.get('tip_percent'):.1f}% → {c}{item.get('per_person'):.2f}/pp"
+            item["_display"] = s
+        return s
+
+    def _append_history_row(self, item):
+        # only one entry changed; avoid the O(N) delete-all/re-insert
+        self.history_list.insert(0, self._format_history_row(item))
+        if self.history_list.size() > 20:
+            self.history_list.delete(20, tk.END)
+
     def _update_history_list(self):
+        # full rebuild, only needed at startup
         self.history_list.delete(0, tk.END)
-        for item in load_history()[:20]:
-            t = time.strftime("%Y-%m-%d %H:%M:%S",
-                              time.localtime(item.get("time", 0)))
-            c = self.currency_var.get() or "$"
-            s = f"{t} — {c}{item.get('bill'):.2f} +{item.get('tip_percent'):.1f}% → {c}{item.get('per_person'):.2f}/pp"
-            self.history_list.insert(tk.END, s)
+        for item in self._history[:20]:
+            self.history_list.insert(tk.END, self._format_history_row(item))
 
     def load_selected_history(self):
         sel = self.history_list.curselection()
         if not sel:
             return
         idx = sel[0]
-        h = load_history()
-        if idx >= len(h):
+        if idx >= len(self._history):
             return
-        item = h[idx]
-        self.bill_var.set(f"{item.get('bill'):.2f}")
+        item = self._history[idx]
+        self.bill_entry.delete(0, tk.END)
+        self.bill_entry.insert(0, f"{item.get('bill'):.2f}")
         self.tip_var.set(float(item.get('tip_percent', 15)))
-        self.people_var.set(int(item.get('people', 1)))
+        self.people_spin.set(int(item.get('people', 1)))
         self._update_tip_label()
 
     def toggle_theme(self):
-        # simple dark/light toggle
-        if not self._use_dark:
-            self.configure(bg="#2e2e2e")
-            self.style.configure(
-                "TLabel", background="#2e2e2e", foreground="#ffffff")
-            self.style.configure("TFrame", background="#2e2e2e")
-            self.style.configure("TButton", background="#444444")
-            self._use_dark = True
-        else:
-            self.configure(bg=None)
-            self.style.configure("TLabel", background=None, foreground=None)
-            self.style.configure("TFrame", background=None)
-            self._use_dark = False
+        # one Tcl call; Tk recomputes all style deltas internally instead
+        # of us re-configuring every style per toggle
+        self._use_dark = not self._use_dark
+        self.style.theme_use("dark" if self._use_dark else "clam")
 
     def show_about(self):
         messagebox.showinfo(